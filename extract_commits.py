@@ -21,11 +21,21 @@ Examples:
 
 import argparse
 import csv
+import io
+import multiprocessing
 import os
+import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
+
+# Counts in a --shortstat summary such as
+# " 3 files changed, 10 insertions(+), 2 deletions(-)". Only the "(+)" and "(-)"
+# markers are matched because git translates the surrounding words.
+INSERTIONS_RE = re.compile(rb'(\d+) [^,]*\(\+\)')
+DELETIONS_RE = re.compile(rb'(\d+) [^,]*\(-\)')
 
 
 class GitCommitExtractor:
@@ -40,7 +50,17 @@ class GitCommitExtractor:
         'omni-msilvetroni'
     ]
     
-    def __init__(self, output_dir: Optional[str] = None, author_filter: Optional[List[str]] = None):
+    # Characters replaced by underscores in CSV file names
+    _NAME_TABLE = str.maketrans({'-': '_', ' ': '_'})
+    
+    # Directories that never hold repositories worth scanning
+    SKIP_DIRS = frozenset({'node_modules', '__pycache__', 'venv'})
+    
+    # Column order of the generated CSV files
+    FIELDNAMES = ('Date', 'Timestamp', 'Author', 'Email', 'Hash', 'Subject', 'Additions', 'Deletions')
+    
+    def __init__(self, output_dir: Optional[str] = None, author_filter: Optional[List[str]] = None,
+                 incremental: bool = False, trust_git_filter: bool = False):
         """
         Initialize the extractor.
         
@@ -49,6 +69,12 @@ class GitCommitExtractor:
                        Defaults to './commits' relative to script location.
             author_filter: List of email addresses or usernames to filter commits.
                           If None, extracts all commits regardless of author.
+            incremental: If True, only commits newer than those already in an
+                        existing CSV file are extracted and added to it.
+            trust_git_filter: If True, rely on git's --author matching alone, which
+                             tests the combined "Name <email>" string. If False,
+                             commits git returns are also checked in Python
+                             against the name and email separately.
         """
         if output_dir is None:
             # Get script directory and use 'commits' folder relative to it
@@ -59,174 +85,289 @@ class GitCommitExtractor:
         
         self.output_dir = output_dir
         self.author_filter = author_filter
+        self.incremental = incremental
+        self.trust_git_filter = trust_git_filter
+        # git's --regexp-ignore-case only folds ASCII, so non-ASCII terms are
+        # matched in Python alone to avoid losing commits
+        git_filter = bool(author_filter) and all(term.isascii() for term in author_filter)
+        # All filter terms in one case-insensitive pattern, searched once per field
+        self._filter_re = (
+            re.compile('|'.join(map(re.escape, author_filter)), re.IGNORECASE)
+            if author_filter and not (trust_git_filter and git_filter) else None
+        )
+        # Get commits with NUL-separated fields: date, timestamp, author, email,
+        # hash, subject; each followed by a one-line --shortstat summary.
+        # NUL cannot occur in commit metadata, so subjects may contain any text.
+        # Merges are diffed against their first parent, as `git show --stat` does.
+        self._log_args = (
+            "log",
+            "--pretty=format:%ad%x00%aI%x00%an%x00%ae%x00%H%x00%s",
+            "--date=short",
+            "--shortstat",
+            "--diff-merges=first-parent"
+        )
+        if git_filter:
+            # Let git drop non-matching commits before they reach the pipe.
+            # Multiple --author patterns are OR-ed; -F keeps them literal.
+            self._log_args += ("--regexp-ignore-case", "--fixed-strings") + tuple(
+                f"--author={term}" for term in author_filter
+            )
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def is_git_repo(self, path: Path) -> bool:
-        """Check if a directory is a Git repository."""
-        try:
-            subprocess.run(
-                ["git", "-C", str(path), "rev-parse", "--git-dir"],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if a directory is a Git repository (or a bare one)."""
+        return (path / '.git').exists() or (path / 'HEAD').exists()
     
     def get_repo_name(self, repo_path: Path) -> str:
         """Extract repository name from path."""
-        return repo_path.name.lower().replace("-", "_").replace(" ", "_")
+        return repo_path.name.lower().translate(self._NAME_TABLE)
     
-    def extract_commits(self, repo_path: Path) -> List[Dict[str, Any]]:
-        """
-        Extract commits from a repository.
-        
-        Args:
-            repo_path: Path to the Git repository.
-            
-        Returns:
-            List of dictionaries containing commit information.
-        """
+    def get_output_file(self, repo_name: str) -> Path:
+        """Return the CSV file used for a repository."""
+        return self.output_dir / f"contributions_report_{repo_name}.csv"
+    
+    def get_head_file(self, repo_name: str) -> Path:
+        """Return the file recording the HEAD a repository's CSV was exported from."""
+        return self.output_dir / f"contributions_report_{repo_name}.head"
+    
+    def resolve_head(self, repo_path: Path) -> Optional[str]:
+        """Return the commit hash HEAD points to, or None if it cannot be resolved."""
         try:
-            # Get commits with format: date|timestamp|author|email|hash|subject
-            cmd = [
-                "git",
-                "-C", str(repo_path),
-                "log",
-                "--pretty=format:%ad|%aI|%an|%ae|%H|%s",
-                "--date=short"
-            ]
-            
             result = subprocess.run(
-                cmd,
+                ["git", "-C", str(repo_path), "rev-parse", "--verify", "--quiet", "HEAD"],
                 capture_output=True,
                 text=True,
                 check=False
             )
-            
-            if result.returncode != 0:
-                print(f"Warning: Could not extract commits from {repo_path}", file=sys.stderr)
-                return []
-            
-            commits = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                
-                try:
-                    parts = line.split('|')
-                    if len(parts) >= 6:
-                        email = parts[3].strip()
-                        author = parts[2].strip()
-                        
-                        # Filter by author if specified
-                        if self.author_filter:
-                            # Check if email or username matches any filter criteria
-                            if not any(
-                                filter_term.lower() in email.lower() or 
-                                filter_term.lower() in author.lower()
-                                for filter_term in self.author_filter
-                            ):
-                                continue  # Skip this commit
-                        
-                        commit = {
-                            'Date': parts[0],
-                            'Timestamp': parts[1],
-                            'Author': author,
-                            'Email': email,
-                            'Hash': parts[4],
-                            'Subject': parts[5],
-                        }
-                        commits.append(commit)
-                except (IndexError, ValueError):
-                    continue
-            
-            return commits
-        
-        except Exception as e:
-            print(f"Error extracting commits from {repo_path}: {e}", file=sys.stderr)
-            return []
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
     
-    def get_commit_stats(self, repo_path: Path, commit_hash: str) -> tuple:
+    def read_export_head(self, repo_name: str) -> Optional[str]:
         """
-        Get additions and deletions for a commit.
+        Read the HEAD recorded by the last incremental export of a repository.
+        
+        The first CSV row is not used for this: it is only the newest commit
+        that matched the author filter, and commits merged in from side
+        branches may be older than it without being its ancestors.
         
         Args:
-            repo_path: Path to the Git repository.
-            commit_hash: Commit hash.
+            repo_name: Name of the repository.
             
         Returns:
-            Tuple of (additions, deletions).
+            The commit hash, or None if no export was recorded.
         """
         try:
-            cmd = [
-                "git",
-                "-C", str(repo_path),
-                "show",
-                "--stat=1000",
-                "--format=",
-                commit_hash
-            ]
+            return self.get_head_file(repo_name).read_text(encoding='ascii').strip() or None
+        except (OSError, UnicodeDecodeError):
+            return None
+    
+    def write_export_head(self, repo_name: str, head: str) -> None:
+        """Record the HEAD a repository's CSV was exported from."""
+        head_file = self.get_head_file(repo_name)
+        try:
+            head_file.write_text(head + '\n', encoding='ascii')
+        except OSError as e:
+            print(f"Warning: Could not record exported HEAD for {repo_name}: {e}", file=sys.stderr)
+            # A stale record would re-add saved commits on the next run
+            self.remove_export_head(repo_name)
+    
+    def remove_export_head(self, repo_name: str) -> bool:
+        """
+        Remove the HEAD recorded for a repository's CSV, if any.
+        
+        Args:
+            repo_name: Name of the repository.
             
+        Returns:
+            True if no record is left, False if it could not be removed.
+        """
+        try:
+            self.get_head_file(repo_name).unlink()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Warning: Could not remove exported HEAD for {repo_name}: {e}", file=sys.stderr)
+            return False
+        return True
+    
+    def remove_partial_reports(self) -> None:
+        """Remove temporary CSV files left behind by interrupted workers."""
+        for tmp_file in self.output_dir.glob('contributions_report_*.csv.tmp'):
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+    
+    def is_ancestor(self, repo_path: Path, commit_hash: str, descendant: str = "HEAD") -> bool:
+        """Check if a commit is reachable from another (HEAD by default)."""
+        try:
             result = subprocess.run(
-                cmd,
+                ["git", "-C", str(repo_path), "merge-base", "--is-ancestor", commit_hash, descendant],
                 capture_output=True,
-                text=True,
                 check=False
             )
+        except OSError:
+            return False
+        return result.returncode == 0
+    
+    def extract_commits(self, repo_path: Path, since: Optional[str] = None,
+                        until: str = "HEAD") -> Iterator[Tuple[Any, ...]]:
+        """
+        Extract commits from a repository.
+        
+        Additions and deletions are collected in the same ``git log`` call
+        via ``--shortstat``, so only one git process is spawned per repository.
+        The output is parsed while git is still writing it.
+        
+        Args:
+            repo_path: Path to the Git repository.
+            since: If given, only commits after this hash (``since..until``) are extracted.
+            until: Revision to read history from. Defaults to HEAD.
             
-            if result.returncode != 0:
-                return (0, 0)
-            
-            additions = 0
-            deletions = 0
+        Yields:
+            One row per commit, newest first, with values in ``FIELDNAMES`` order.
             
-            for line in result.stdout.split('\n'):
-                if '+' in line or '-' in line:
-                    parts = line.split()
-                    for i, part in enumerate(parts):
-                        if part == '+' and i > 0:
-                            try:
-                                additions += int(parts[i - 1])
-                            except ValueError:
-                                pass
-                        elif part == '-' and i > 0:
-                            try:
-                                deletions += int(parts[i - 1])
-                            except ValueError:
-                                pass
+        Raises:
+            subprocess.SubprocessError: If git log could not be run or failed.
+        """
+        try:
+            cmd = ("git", "-C", str(repo_path)) + self._log_args
+            cmd += (f"{since}..{until}" if since else until,)
             
-            return (additions, deletions)
+            with subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=1 << 20
+            ) as proc:
+                filter_re = self._filter_re
+                header = None
+                additions = deletions = 0
+                # Lines are parsed as bytes; fields are decoded only once kept
+                for line in proc.stdout:
+                    line = line.rstrip(b'\n')
+                    if not line:
+                        continue
+                    
+                    # Shortstat summary belonging to the current commit
+                    if b'\0' not in line:
+                        if header is not None:
+                            match = INSERTIONS_RE.search(line)
+                            if match:
+                                additions = int(match.group(1))
+                            match = DELETIONS_RE.search(line)
+                            if match:
+                                deletions = int(match.group(1))
+                        continue
+                    
+                    # A new header line completes the previous commit
+                    if header is not None:
+                        yield header + (additions, deletions)
+                        header = None
+                    
+                    try:
+                        date, timestamp, author, email, commit_hash, subject = line.split(b'\0', 5)
+                    except ValueError:
+                        continue
+                    
+                    email = email.strip().decode('utf-8', 'replace')
+                    author = author.strip().decode('utf-8', 'replace')
+                    
+                    # Filter by author if specified
+                    if filter_re:
+                        # Check if email or username matches any filter criteria
+                        if not (filter_re.search(email) or filter_re.search(author)):
+                            continue  # Skip this commit
+                    
+                    header = (
+                        date.decode('ascii'),
+                        timestamp.decode('ascii'),
+                        author,
+                        email,
+                        commit_hash.decode('ascii'),
+                        subject.decode('utf-8', 'replace'),
+                    )
+                    additions = deletions = 0
+                
+                if header is not None:
+                    yield header + (additions, deletions)
+        
+        except Exception as e:
+            print(f"Error extracting commits from {repo_path}: {e}", file=sys.stderr)
+            raise subprocess.SubprocessError(str(e)) from e
         
-        except Exception:
-            return (0, 0)
+        if proc.returncode != 0:
+            print(f"Warning: Could not extract commits from {repo_path}", file=sys.stderr)
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
     
-    def save_to_csv(self, commits: List[Dict[str, Any]], repo_name: str) -> None:
+    def save_to_csv(self, rows: Iterable[Tuple[Any, ...]], repo_name: str,
+                    previous: Optional[Path] = None) -> bool:
         """
         Save commits to a CSV file.
         
+        Rows are written as they arrive through an 8 MiB write buffer, so the
+        commits of a repository are never all held in memory at once.
+        
         Args:
-            commits: List of commit dictionaries.
+            rows: Iterable of commit rows with values in ``FIELDNAMES`` order.
             repo_name: Name of the repository (used for filename).
+            previous: Existing CSV file whose rows are kept after the new ones.
+            
+        Returns:
+            True if the CSV file holds at least one commit, False otherwise.
         """
-        if not commits:
-            print(f"No commits to save for {repo_name}")
-            return
-        
-        output_file = self.output_dir / f"contributions_report_{repo_name}.csv"
-        
-        fieldnames = ['Date', 'Timestamp', 'Author', 'Email', 'Hash', 'Subject', 'Additions', 'Deletions']
+        rows = iter(rows)
+        output_file = self.get_output_file(repo_name)
+        # Written aside and swapped in, so a failed run never replaces the report
+        target = output_file.with_name(output_file.name + '.tmp')
         
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(commits)
+            first = next(rows, None)
+            if first is None:
+                if previous is not None:
+                    print(f"✓ No new commits for {repo_name}")
+                    return True
+                print(f"No commits to save for {repo_name}")
+                return False
+            
+            buffered = io.BufferedWriter(io.FileIO(target, 'w'), buffer_size=8 << 20)
+            with io.TextIOWrapper(buffered, encoding='utf-8', newline='', write_through=False) as f:
+                writer = csv.writer(f)
+                writer.writerow(self.FIELDNAMES)
+                writer.writerow(first)
+                count = 1
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+                
+                # New rows go first, followed by those already saved
+                if previous is not None:
+                    f.flush()
+                    with open(previous, 'rb') as old:
+                        old.readline()  # Skip header
+                        shutil.copyfileobj(old, buffered, 8 << 20)
             
-            print(f"✓ Saved {len(commits)} commits to {output_file}")
+            os.replace(target, output_file)
+            if previous is not None:
+                print(f"✓ Added {count} new commits to {output_file}")
+            else:
+                print(f"✓ Saved {count} commits to {output_file}")
+            return True
+        
+        except subprocess.SubprocessError:
+            # Already reported by extract_commits
+            return False
         
         except Exception as e:
             print(f"Error saving CSV for {repo_name}: {e}", file=sys.stderr)
+            return False
+        
+        finally:
+            if target.exists():
+                target.unlink()
     
     def extract_from_repo(self, repo_path: Path) -> bool:
         """
@@ -247,29 +388,81 @@ class GitCommitExtractor:
             filter_info = f" (filtering by: {', '.join(self.author_filter)})"
         print(f"Extracting commits from: {repo_path.name}{filter_info}")
         
-        commits = self.extract_commits(repo_path)
+        previous = None
+        since = None
+        head = None
+        if self.incremental:
+            # Pin HEAD so the recorded export matches exactly what was read
+            head = self.resolve_head(repo_path)
+            output_file = self.get_output_file(repo_name)
+            old_head = self.read_export_head(repo_name)
+            # Fall back to a full extraction if history was rewritten
+            if head and old_head and output_file.exists() and self.is_ancestor(repo_path, old_head, head):
+                previous = output_file
+                since = old_head
         
-        if commits:
-            # Get stats for each commit
-            for commit in commits:
-                additions, deletions = self.get_commit_stats(
-                    repo_path,
-                    commit['Hash']
-                )
-                commit['Additions'] = additions
-                commit['Deletions'] = deletions
-            
-            self.save_to_csv(commits, repo_name)
-            return True
+        # Drop the recorded HEAD before the CSV is replaced, so an interrupted
+        # run falls back to a full export instead of re-adding saved commits
+        if not self.remove_export_head(repo_name):
+            return False
         
-        return False
+        rows = self.extract_commits(repo_path, since=since, until=head or "HEAD")
+        saved = self.save_to_csv(rows, repo_name, previous=previous)
+        if saved and head:
+            self.write_export_head(repo_name, head)
+        return saved
     
-    def extract_from_directory(self, search_dir: Optional[Path] = None) -> int:
+    def find_repos(self, search_dir: Path, max_depth: Optional[int] = None) -> Iterator[Path]:
+        """
+        Find Git repositories below a directory.
+        
+        The walk does not descend into a repository once it is found, nor into
+        hidden directories or anything listed in ``SKIP_DIRS``.
+        
+        Args:
+            search_dir: Directory to search in.
+            max_depth: Maximum number of levels below search_dir to descend.
+                      If None, the search is unbounded.
+                      
+        Yields:
+            Paths of the repositories found.
+        """
+        stack = [(search_dir, 0)]
+        while stack:
+            directory, depth = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            if any(entry.name == '.git' for entry in entries):
+                yield Path(directory)
+                continue
+            
+            if max_depth is not None and depth >= max_depth:
+                continue
+            
+            for entry in entries:
+                if entry.name.startswith('.') or entry.name in self.SKIP_DIRS:
+                    continue
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, depth + 1))
+                except OSError:
+                    continue
+    
+    def extract_from_directory(self, search_dir: Optional[Path] = None,
+                               max_depth: Optional[int] = None,
+                               jobs: int = 1) -> int:
         """
         Search for Git repositories and extract commits from all of them.
         
         Args:
             search_dir: Directory to search in. Defaults to current directory.
+            max_depth: Maximum directory depth to search. Defaults to unlimited.
+            jobs: Number of repositories processed in parallel. Worker processes
+                  are only started when there is more than one CSV to write.
             
         Returns:
             Number of repositories processed.
@@ -285,20 +478,86 @@ class GitCommitExtractor:
         
         print(f"Searching for Git repositories in: {search_dir}")
         
-        repos_found = 0
+        repo_paths = list(self.find_repos(search_dir, max_depth))
         
-        # Search for .git directories
-        for git_dir in search_dir.rglob('.git'):
-            repo_path = git_dir.parent
-            
-            # Skip if it's a submodule or already processed
-            if repo_path.name.startswith('.'):
-                continue
-            
-            if self.extract_from_repo(repo_path):
-                repos_found += 1
+        if not repo_paths:
+            return 0
         
-        return repos_found
+        # Repositories whose names normalize alike share one CSV file, so they
+        # must not run in parallel; each group is processed in order
+        groups: Dict[str, List[Path]] = {}
+        for repo_path in repo_paths:
+            groups.setdefault(self.get_repo_name(repo_path), []).append(repo_path)
+        
+        for repo_name, paths in groups.items():
+            if len(paths) > 1:
+                print(
+                    f"Warning: {', '.join(str(p) for p in paths)} all write "
+                    f"contributions_report_{repo_name}.csv; the last one processed wins",
+                    file=sys.stderr
+                )
+        
+        if jobs <= 1 or len(groups) <= 1:
+            return sum(
+                1 for paths in groups.values() for repo_path in paths
+                if self.extract_from_repo(repo_path)
+            )
+        
+        # Repositories are independent and mostly wait on git, so process them in parallel
+        options = {
+            'output_dir': self.output_dir,
+            'author_filter': self.author_filter,
+            'incremental': self.incremental,
+            'trust_git_filter': self.trust_git_filter,
+        }
+        tasks = [(paths, options) for paths in groups.values()]
+        with multiprocessing.Pool(processes=min(jobs, len(tasks))) as pool:
+            try:
+                return sum(pool.imap_unordered(_extract_group, tasks))
+            except KeyboardInterrupt:
+                # Stop queued and running repositories alike
+                pool.terminate()
+                self.remove_partial_reports()
+                raise
+
+
+def _extract_group(job: Tuple[List[Path], Dict[str, Any]]) -> int:
+    """
+    Extract commits from repositories sharing one CSV file, in a worker process.
+    
+    A fresh extractor is built in the worker rather than pickling the parent's.
+    
+    Args:
+        job: Tuple of (repo_paths, GitCommitExtractor keyword arguments).
+        
+    Returns:
+        Number of repositories processed successfully.
+    """
+    repo_paths, options = job
+    extractor = GitCommitExtractor(**options)
+    return sum(1 for repo_path in repo_paths if extractor.extract_from_repo(repo_path))
+
+
+def _non_negative_int(value: str) -> int:
+    """Parse a command-line value that must be an integer of at least 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must not be negative, got {number}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command-line value that must be an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
 
 
 def main():
@@ -346,6 +605,29 @@ Examples:
         help='Search in subdirectories recursively'
     )
     
+    parser.add_argument(
+        '--max-depth',
+        type=_non_negative_int,
+        help='Maximum directory depth when searching for repositories (default: unlimited)',
+        default=None
+    )
+    
+    parser.add_argument(
+        '--jobs', '-j',
+        type=_positive_int,
+        help='Number of repositories processed in parallel; 1 runs them in this process '
+             '(default: number of CPUs)',
+        default=os.cpu_count() or 1
+    )
+    
+    parser.add_argument(
+        '--incremental', '-i',
+        action='store_true',
+        help='Only add commits made since the last incremental run, whose HEAD is '
+             'recorded in a .head file next to each CSV '
+             '(assumes the same author filter as that run)'
+    )
+    
     parser.add_argument(
         '--my-commits', '-m',
         action='store_true',
@@ -356,7 +638,8 @@ Examples:
         '--author',
         type=str,
         nargs='+',
-        help='Filter commits by email or username (can specify multiple)',
+        help='Filter commits by email or username: a commit is kept if any term is a '
+             'case-insensitive substring of its author name or email (can specify multiple)',
         default=None
     )
     
@@ -373,7 +656,11 @@ Examples:
         else:
             print(f"📧 Filtering commits by authors: {', '.join(author_filter)}\n")
         
-        extractor = GitCommitExtractor(output_dir=args.output, author_filter=author_filter)
+        extractor = GitCommitExtractor(
+            output_dir=args.output,
+            author_filter=author_filter,
+            incremental=args.incremental
+        )
         
         if args.repo:
             # Extract from specific repository
@@ -385,19 +672,27 @@ Examples:
         elif args.search or args.all:
             # Search in directory
             search_dir = Path(args.search or '.').resolve()
-            repos_processed = extractor.extract_from_directory(search_dir)
+            repos_processed = extractor.extract_from_directory(
+                search_dir,
+                max_depth=args.max_depth,
+                jobs=args.jobs
+            )
             print(f"\nProcessed {repos_processed} repositories")
             sys.exit(0 if repos_processed > 0 else 1)
         
         else:
             # Default: search in current directory
-            repos_processed = extractor.extract_from_directory(Path.cwd())
-            
+            repos_processed = extractor.extract_from_directory(
+                Path.cwd(),
+                max_depth=args.max_depth,
+                jobs=args.jobs
+            )
+        
             if repos_processed == 0:
                 print("No Git repositories found in current directory")
                 print("Usage: python3 extract_commits.py --help")
                 sys.exit(1)
-            
+        
             print(f"\n✓ Processed {repos_processed} repositories")
             print(f"CSV files saved to: {extractor.output_dir}")
             sys.exit(0)